@@ -1,37 +1,54 @@
 """Combined Strategy Analyzer"""
 import pandas as pd
+import numpy as np
+
+def _instrument_mask(df, instruments):
+    # Compare integer category codes rather than hashing every string
+    instrument = df['INSTRUMENT'].astype('category')
+    codes = instrument.cat.codes.to_numpy()
+    wanted = instrument.cat.categories.get_indexer(instruments)
+    
+    mask = np.zeros(len(codes), dtype=bool)
+    for code in wanted[wanted >= 0]:
+        mask |= codes == code
+    return mask
+
+def _to_soa(df, symbols, numeric_cols):
+    # Contiguous column arrays plus SYMBOL encoded against a shared index;
+    # NaN becomes 0 so bincount sums skip it the way Series.sum() does
+    soa = {col.lower(): np.nan_to_num(df[col].to_numpy(dtype=np.float64)) for col in numeric_cols}
+    soa['symbol_codes'] = symbols.get_indexer(df['SYMBOL'])
+    return soa
 
 class CombinedStrategyAnalyzer:
     def __init__(self, options_data, futures_data):
-        self.options = options_data[options_data['INSTRUMENT'].isin(['OPTSTK', 'OPTIDX'])]
-        self.futures = futures_data[futures_data['INSTRUMENT'].isin(['FUTSTK', 'FUTIDX'])]
+        self.options = options_data[_instrument_mask(options_data, ['OPTSTK', 'OPTIDX'])]
+        self.futures = futures_data[_instrument_mask(futures_data, ['FUTSTK', 'FUTIDX'])]
+        
+        self.symbols = pd.Index(self.futures['SYMBOL'].unique())
+        self._futures_soa = _to_soa(self.futures, self.symbols, ['CHG_IN_OI', 'CHG'])
+        self._options_soa = _to_soa(self.options, self.symbols, ['OPEN_INT'])
+        self._options_soa['is_put'] = (self.options['OPTION_TYP'] == 'PE').to_numpy()
+        self._options_soa['is_call'] = (self.options['OPTION_TYP'] == 'CE').to_numpy()
     
     def find_divergence(self):
-        opportunities = []
+        n_symbols = len(self.symbols)
+        codes = self._futures_soa['symbol_codes']
+        fut_oi_change = np.bincount(codes, weights=self._futures_soa['chg_in_oi'], minlength=n_symbols)
+        fut_price_change = np.bincount(codes, weights=self._futures_soa['chg'], minlength=n_symbols)
         
-        for symbol in self.futures['SYMBOL'].unique():
-            fut_data = self.futures[self.futures['SYMBOL'] == symbol]
-            opt_data = self.options[self.options['SYMBOL'] == symbol]
-            
-            if fut_data.empty or opt_data.empty:
-                continue
-            
-            fut_oi_change = fut_data['CHG_IN_OI'].sum()
-            fut_price_change = fut_data['CHG'].sum()
-            
-            puts = opt_data[opt_data['OPTION_TYP'] == 'PE']
-            calls = opt_data[opt_data['OPTION_TYP'] == 'CE']
-            
-            put_oi = puts['OPEN_INT'].sum()
-            call_oi = calls['OPEN_INT'].sum()
-            pcr = put_oi / call_oi if call_oi > 0 else 0
-            
-            if fut_oi_change > 0 and fut_price_change > 0 and pcr > 1.2:
-                opportunities.append({
-                    'symbol': symbol,
-                    'signal': 'BULLISH',
-                    'strategy': 'Long Futures or Buy Calls',
-                    'pcr': pcr
-                })
+        opt = self._options_soa
+        known = opt['symbol_codes'] >= 0
+        puts = known & opt['is_put']
+        calls = known & opt['is_call']
+        put_oi = np.bincount(opt['symbol_codes'][puts], weights=opt['open_int'][puts], minlength=n_symbols)
+        call_oi = np.bincount(opt['symbol_codes'][calls], weights=opt['open_int'][calls], minlength=n_symbols)
+        pcr = np.divide(put_oi, call_oi, out=np.zeros(n_symbols), where=call_oi > 0)
         
-        return pd.DataFrame(opportunities)
+        mask = (fut_oi_change > 0) & (fut_price_change > 0) & (pcr > 1.2)
+        return pd.DataFrame({
+            'symbol': self.symbols[mask],
+            'signal': 'BULLISH',
+            'strategy': 'Long Futures or Buy Calls',
+            'pcr': pcr[mask]
+        })
@@ -1,5 +1,6 @@
 """Futures Data Analysis"""
 import pandas as pd
+import numpy as np
 
 class FuturesAnalyzer:
     def __init__(self, data):
@@ -7,33 +8,33 @@ class FuturesAnalyzer:
         self.futures_data = data[data['INSTRUMENT'].isin(['FUTSTK', 'FUTIDX'])]
     
     def find_buildup_signals(self):
-        signals = []
+        totals = (
+            self.futures_data
+            .groupby('SYMBOL', sort=False, observed=True)[['CHG_IN_OI', 'CHG']]
+            .sum()
+        )
+        oi_change = totals['CHG_IN_OI'].to_numpy()
+        price_change = totals['CHG'].to_numpy()
         
-        for symbol in self.futures_data['SYMBOL'].unique():
-            symbol_data = self.futures_data[self.futures_data['SYMBOL'] == symbol]
-            
-            oi_change = symbol_data['CHG_IN_OI'].sum()
-            price_change = symbol_data['CHG'].sum()
-            
-            signal = self._interpret_buildup(oi_change, price_change)
-            
-            if signal != "Neutral":
-                signals.append({
-                    'symbol': symbol,
-                    'signal': signal,
-                    'oi_change': oi_change,
-                    'price_change': price_change
-                })
+        signal = self._classify_buildup(oi_change, price_change)
+        mask = signal != "Neutral"
         
-        return pd.DataFrame(signals)
+        return pd.DataFrame({
+            'symbol': totals.index.to_numpy()[mask],
+            'signal': signal[mask],
+            'oi_change': oi_change[mask],
+            'price_change': price_change[mask]
+        })
     
-    def _interpret_buildup(self, oi_change, price_change):
-        if oi_change > 0 and price_change > 0:
-            return "Long Buildup"
-        elif oi_change > 0 and price_change < 0:
-            return "Short Buildup"
-        elif oi_change < 0 and price_change > 0:
-            return "Short Covering"
-        elif oi_change < 0 and price_change < 0:
-            return "Long Unwinding"
-        return "Neutral"
+    def _classify_buildup(self, oi_change, price_change):
+        oi_change = np.asarray(oi_change)
+        price_change = np.asarray(price_change)
+        
+        conditions = [
+            (oi_change > 0) & (price_change > 0),
+            (oi_change > 0) & (price_change < 0),
+            (oi_change < 0) & (price_change > 0),
+            (oi_change < 0) & (price_change < 0)
+        ]
+        choices = ["Long Buildup", "Short Buildup", "Short Covering", "Long Unwinding"]
+        return np.select(conditions, choices, default="Neutral").astype(object)
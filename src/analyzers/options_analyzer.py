@@ -6,44 +6,54 @@ class OptionsAnalyzer:
     def __init__(self, data):
         self.data = data
         self.options_data = data[data['INSTRUMENT'].isin(['OPTSTK', 'OPTIDX'])]
+        self._oi_by_symbol = None
     
     def calculate_pcr(self, symbol=None):
+        totals = self._symbol_oi_totals()
+        
         if symbol:
-            df = self.options_data[self.options_data['SYMBOL'] == symbol]
+            if symbol not in totals.index:
+                return 0
+            put_oi = totals.at[symbol, 'PE']
+            call_oi = totals.at[symbol, 'CE']
         else:
-            df = self.options_data
-        
-        puts = df[df['OPTION_TYP'] == 'PE']
-        calls = df[df['OPTION_TYP'] == 'CE']
-        
-        put_oi = puts['OPEN_INT'].sum()
-        call_oi = calls['OPEN_INT'].sum()
+            put_oi = totals['PE'].sum()
+            call_oi = totals['CE'].sum()
         
         return put_oi / call_oi if call_oi > 0 else 0
     
+    def _symbol_oi_totals(self):
+        # PE/CE open interest per symbol, built once and reused across calls
+        if self._oi_by_symbol is None:
+            self._oi_by_symbol = (
+                self.options_data
+                .groupby(['SYMBOL', 'OPTION_TYP'], sort=False, observed=True)['OPEN_INT']
+                .sum()
+                .unstack('OPTION_TYP', fill_value=0)
+                .reindex(columns=['PE', 'CE'], fill_value=0)
+            )
+        return self._oi_by_symbol
+    
     def find_high_oi_buildup(self, threshold=1.5):
-        opportunities = []
+        # First CE/PE contract per (symbol, strike), in the order the loop visited them
+        df = self.options_data[self.options_data['OPTION_TYP'].isin(['CE', 'PE'])]
+        df = df.drop_duplicates(['SYMBOL', 'STRIKE_PR', 'OPTION_TYP'])
+        order = np.lexsort((
+            (df['OPTION_TYP'] == 'PE').to_numpy(),
+            df.groupby(['SYMBOL', 'STRIKE_PR'], sort=False, observed=True).ngroup().to_numpy(),
+            pd.factorize(df['SYMBOL'])[0]
+        ))
+        df = df.iloc[order]
+        oi = df['OPEN_INT'].to_numpy(dtype=np.float64)
+        oi_change = df['CHG_IN_OI'].to_numpy(dtype=np.float64)
         
-        for symbol in self.options_data['SYMBOL'].unique():
-            symbol_data = self.options_data[self.options_data['SYMBOL'] == symbol]
-            
-            for strike in symbol_data['STRIKE_PR'].unique():
-                strike_data = symbol_data[symbol_data['STRIKE_PR'] == strike]
-                
-                for option_type in ['CE', 'PE']:
-                    opt_data = strike_data[strike_data['OPTION_TYP'] == option_type]
-                    
-                    if not opt_data.empty:
-                        oi = opt_data['OPEN_INT'].values[0]
-                        oi_change = opt_data['CHG_IN_OI'].values[0]
-                        
-                        if oi > 0 and abs(oi_change / oi) > threshold:
-                            opportunities.append({
-                                'symbol': symbol,
-                                'strike': strike,
-                                'type': option_type,
-                                'oi': oi,
-                                'oi_change_pct': (oi_change / oi) * 100
-                            })
+        ratio = np.divide(oi_change, oi, out=np.zeros_like(oi), where=oi > 0)
+        mask = np.abs(ratio) > threshold
         
-        return pd.DataFrame(opportunities)
+        return pd.DataFrame({
+            'symbol': df['SYMBOL'].to_numpy()[mask],
+            'strike': df['STRIKE_PR'].to_numpy()[mask],
+            'type': df['OPTION_TYP'].to_numpy()[mask],
+            'oi': df['OPEN_INT'].to_numpy()[mask],
+            'oi_change_pct': ratio[mask] * 100
+        })
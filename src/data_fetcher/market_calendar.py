@@ -1,5 +1,5 @@
 """Market Calendar Utilities"""
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 class MarketCalendar:
     NSE_HOLIDAYS_2024 = [
@@ -12,6 +12,10 @@ class MarketCalendar:
         "2025-08-15", "2025-10-02", "2025-12-25"
     ]
     
+    NSE_HOLIDAYS = frozenset(
+        date.fromisoformat(d) for d in NSE_HOLIDAYS_2024 + NSE_HOLIDAYS_2025
+    )
+    
     @staticmethod
     def is_market_open(check_date=None):
         if check_date is None:
@@ -20,6 +24,6 @@ class MarketCalendar:
         if check_date.weekday() >= 5:
             return False
         
-        date_str = check_date.strftime("%Y-%m-%d")
-        all_holidays = MarketCalendar.NSE_HOLIDAYS_2024 + MarketCalendar.NSE_HOLIDAYS_2025
-        return date_str not in all_holidays
+        if isinstance(check_date, datetime):
+            check_date = check_date.date()
+        return check_date not in MarketCalendar.NSE_HOLIDAYS
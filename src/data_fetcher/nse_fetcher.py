@@ -1,17 +1,64 @@
 """NSE Bhavcopy Data Fetcher"""
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+import threading
 from datetime import datetime, timedelta
 import zipfile
-import io
+import shutil
+import tempfile
 import pandas as pd
 from pathlib import Path
+from src.data_fetcher.market_calendar import MarketCalendar
+
+BHAVCOPY_DTYPES = {
+    'INSTRUMENT': 'category',
+    'SYMBOL': 'category',
+    'EXPIRY_DT': 'category',
+    'STRIKE_PR': 'float64',
+    'OPTION_TYP': 'category',
+    'OPEN': 'float64',
+    'HIGH': 'float64',
+    'LOW': 'float64',
+    'CLOSE': 'float64',
+    'SETTLE_PR': 'float64',
+    'CONTRACTS': 'int64',
+    'VAL_INLAKH': 'float64',
+    'OPEN_INT': 'int64',
+    'CHG_IN_OI': 'int64',
+    'CHG': 'float64',
+    'TIMESTAMP': 'string'
+}
+BHAVCOPY_USECOLS = tuple(BHAVCOPY_DTYPES)
 
 class NSEBhavcopyFetcher:
     BASE_URL = "https://nsearchives.nseindia.com/content/historical/DERIVATIVES"
+    CHUNK_SIZE = 1 << 20
     
     def __init__(self, data_dir="data/raw"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        
+        self._retry = Retry(total=5, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+        self._local = threading.local()
+    
+    @property
+    def session(self):
+        # requests.Session is not guaranteed thread-safe, so each thread
+        # (including every fetch_range worker) keeps its own pooled session
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(max_retries=self._retry))
+            self._local.session = session
+        return session
+    
+    def bhavcopy_path(self, date):
+        return self.data_dir / f"fo_{date.strftime('%Y%m%d')}.parquet"
+    
+    def load_bhavcopy(self, date, columns=None):
+        return pd.read_parquet(self.bhavcopy_path(date), columns=columns)
     
     def fetch_bhavcopy(self, date=None):
         if date is None:
@@ -22,15 +69,35 @@ class NSEBhavcopyFetcher:
         fo_url = f"{self.BASE_URL}/{date_path}/fo{date_str}bhav.csv.zip"
         
         try:
-            response = requests.get(fo_url, timeout=30)
-            response.raise_for_status()
-            
-            with zipfile.ZipFile(io.BytesIO(response.content)) as z:
-                csv_name = z.namelist()[0]
-                df = pd.read_csv(z.open(csv_name))
-                output_file = self.data_dir / f"fo_{date.strftime('%Y%m%d')}.csv"
-                df.to_csv(output_file, index=False)
-                return df
+            with self.session.get(fo_url, stream=True, timeout=30) as response, \
+                    tempfile.TemporaryFile() as tmp:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, tmp, length=self.CHUNK_SIZE)
+                tmp.seek(0)
+                
+                with zipfile.ZipFile(tmp) as z:
+                    csv_name = z.namelist()[0]
+                    df = pd.read_csv(
+                        z.open(csv_name),
+                        dtype=BHAVCOPY_DTYPES,
+                        usecols=lambda col: col in BHAVCOPY_USECOLS,
+                        engine='c'
+                    )
+                    df.to_parquet(self.bhavcopy_path(date), compression='snappy', index=False)
+                    return df
         except Exception as e:
             print(f"Error fetching data: {e}")
             return None
+    
+    def fetch_range(self, start, end, max_workers=4):
+        dates = []
+        date = start
+        while date <= end:
+            if MarketCalendar.is_market_open(date):
+                dates.append(date)
+            date += timedelta(days=1)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames = executor.map(self.fetch_bhavcopy, dates)
+            return {d: df for d, df in zip(dates, frames) if df is not None}
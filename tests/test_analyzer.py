@@ -1,2 +1,97 @@
 """Test analyzer"""
 import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.analyzers.options_analyzer import OptionsAnalyzer
+from src.analyzers.futures_analyzer import FuturesAnalyzer
+from src.analyzers.combined_strategy import CombinedStrategyAnalyzer
+
+
+def make_bhavcopy(rows):
+    columns = ['INSTRUMENT', 'SYMBOL', 'STRIKE_PR', 'OPTION_TYP', 'OPEN_INT', 'CHG_IN_OI', 'CHG']
+    return pd.DataFrame(rows, columns=columns)
+
+
+SAMPLE = make_bhavcopy([
+    ['FUTSTK', 'AAA', 0.0, 'XX', 1000, 100, 2.0],
+    ['FUTSTK', 'BBB', 0.0, 'XX', 1000, 50, -1.0],
+    ['FUTSTK', 'CCC', 0.0, 'XX', 1000, -20, 1.0],
+    ['FUTIDX', 'DDD', 0.0, 'XX', 1000, 0, 0.0],
+    ['OPTSTK', 'AAA', 110.0, 'PE', 100, -200, 1.0],
+    ['OPTSTK', 'AAA', 100.0, 'CE', 200, 500, 1.0],
+    ['OPTSTK', 'AAA', 100.0, 'PE', 300, 30, 1.0],
+    ['OPTSTK', 'AAA', 100.0, 'CE', 100, 5000, 1.0],
+    ['OPTSTK', 'BBB', 100.0, 'CE', 100, 10, 1.0],
+    ['OPTSTK', 'BBB', 100.0, 'PE', 50, 10, 1.0],
+    ['OPTSTK', 'EEE', 100.0, 'PE', 400, 0, 1.0],
+    ['OPTSTK', 'EEE', 100.0, 'CE', 100, 0, 1.0],
+    ['OPTSTK', 'EEE', 120.0, 'CE', 0, 100, 1.0],
+    ['OPTSTK', 'EEE', 130.0, 'XX', 100, 1000, 1.0]
+])
+
+
+class TestOptionsAnalyzer(unittest.TestCase):
+    def test_calculate_pcr(self):
+        analyzer = OptionsAnalyzer(SAMPLE)
+        
+        self.assertAlmostEqual(analyzer.calculate_pcr(), 850 / 500)
+        self.assertAlmostEqual(analyzer.calculate_pcr('AAA'), 400 / 300)
+        self.assertAlmostEqual(analyzer.calculate_pcr('BBB'), 0.5)
+        self.assertEqual(analyzer.calculate_pcr('ZZZ'), 0)
+    
+    def test_find_high_oi_buildup(self):
+        result = OptionsAnalyzer(SAMPLE).find_high_oi_buildup()
+        
+        # Only the first contract per strike/type counts, and non CE/PE rows are ignored
+        self.assertEqual(list(result['symbol']), ['AAA', 'AAA'])
+        self.assertEqual(list(result['strike']), [110.0, 100.0])
+        self.assertEqual(list(result['type']), ['PE', 'CE'])
+        self.assertEqual(list(result['oi']), [100, 200])
+        np.testing.assert_allclose(result['oi_change_pct'], [-200.0, 250.0])
+
+
+class TestFuturesAnalyzer(unittest.TestCase):
+    def test_find_buildup_signals(self):
+        result = FuturesAnalyzer(SAMPLE).find_buildup_signals()
+        
+        self.assertEqual(list(result['symbol']), ['AAA', 'BBB', 'CCC'])
+        self.assertEqual(list(result['signal']), ['Long Buildup', 'Short Buildup', 'Short Covering'])
+        self.assertEqual(list(result['oi_change']), [100, 50, -20])
+
+
+class TestCombinedStrategyAnalyzer(unittest.TestCase):
+    def test_find_divergence(self):
+        result = CombinedStrategyAnalyzer(SAMPLE, SAMPLE).find_divergence()
+        
+        # EEE has a high PCR but no futures, so it is never considered
+        self.assertEqual(list(result['symbol']), ['AAA'])
+        self.assertEqual(list(result['signal']), ['BULLISH'])
+        self.assertAlmostEqual(result['pcr'].iloc[0], 400 / 300)
+    
+    def test_find_divergence_empty(self):
+        empty = make_bhavcopy([])
+        
+        result = CombinedStrategyAnalyzer(empty, empty).find_divergence()
+        
+        self.assertTrue(result.empty)
+        self.assertEqual(list(result.columns), ['symbol', 'signal', 'strategy', 'pcr'])
+    
+    def test_find_divergence_skips_nan(self):
+        data = make_bhavcopy([
+            ['FUTSTK', 'AAA', 0.0, 'XX', 1000, 100, 2.0],
+            ['FUTSTK', 'AAA', 0.0, 'XX', 1000, 50, np.nan],
+            ['OPTSTK', 'AAA', 100.0, 'PE', 300, 10, 1.0],
+            ['OPTSTK', 'AAA', 100.0, 'PE', np.nan, 10, 1.0],
+            ['OPTSTK', 'AAA', 100.0, 'CE', 200, 10, 1.0]
+        ])
+        
+        result = CombinedStrategyAnalyzer(data, data).find_divergence()
+        
+        self.assertEqual(list(result['symbol']), ['AAA'])
+        self.assertAlmostEqual(result['pcr'].iloc[0], 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
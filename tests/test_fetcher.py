@@ -1,2 +1,99 @@
 """Test data fetcher"""
+import io
+import tempfile
+import threading
 import unittest
+import zipfile
+from datetime import datetime
+from unittest import mock
+
+import pandas as pd
+
+from src.data_fetcher.nse_fetcher import NSEBhavcopyFetcher
+
+
+# Same layout as the NSE file: no CHG column and a trailing comma
+CSV = (
+    "INSTRUMENT,SYMBOL,EXPIRY_DT,STRIKE_PR,OPTION_TYP,OPEN_INT,CHG_IN_OI,TIMESTAMP,\n"
+    "FUTSTK,AAA,25-Jan-2024,0,XX,1000,100,25-JAN-2024,\n"
+    "OPTSTK,AAA,25-Jan-2024,22150.55,CE,200,-50,25-JAN-2024,\n"
+)
+
+
+def zipped_response(csv_text):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as z:
+        z.writestr('fo25JAN2024bhav.csv', csv_text)
+    buffer.seek(0)
+    
+    response = mock.MagicMock()
+    response.__enter__.return_value = response
+    response.raw = buffer
+    return response
+
+
+class TestNSEBhavcopyFetcher(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.fetcher = NSEBhavcopyFetcher(data_dir=self.tmp_dir.name)
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def fetch(self, date, response):
+        with mock.patch.object(self.fetcher.session, 'get', return_value=response) as get:
+            return self.fetcher.fetch_bhavcopy(date), get
+    
+    def test_fetch_bhavcopy(self):
+        date = datetime(2024, 1, 25)
+        
+        df, get = self.fetch(date, zipped_response(CSV))
+        
+        self.assertIn('/2024/Jan/fo25JAN2024bhav.csv.zip', get.call_args[0][0])
+        self.assertEqual(list(df['SYMBOL']), ['AAA', 'AAA'])
+        self.assertEqual(list(df['OPEN_INT']), [1000, 200])
+        self.assertEqual(list(df['STRIKE_PR']), [0.0, 22150.55])
+        self.assertIsInstance(df['INSTRUMENT'].dtype, pd.CategoricalDtype)
+        self.assertFalse(any(col.startswith('Unnamed') for col in df.columns))
+        
+        loaded = self.fetcher.load_bhavcopy(date)
+        pd.testing.assert_frame_equal(loaded, df)
+        
+        projected = self.fetcher.load_bhavcopy(date, columns=['SYMBOL', 'OPEN_INT'])
+        self.assertEqual(list(projected.columns), ['SYMBOL', 'OPEN_INT'])
+    
+    def test_fetch_bhavcopy_error_returns_none(self):
+        response = zipped_response(CSV)
+        response.raise_for_status.side_effect = Exception("404")
+        
+        df, _ = self.fetch(datetime(2024, 1, 25), response)
+        
+        self.assertIsNone(df)
+        self.assertFalse(self.fetcher.bhavcopy_path(datetime(2024, 1, 25)).exists())
+    
+    def test_session_is_per_thread(self):
+        sessions = []
+        worker = threading.Thread(target=lambda: sessions.append(self.fetcher.session))
+        worker.start()
+        worker.join()
+        
+        self.assertIs(self.fetcher.session, self.fetcher.session)
+        self.assertIsNot(sessions[0], self.fetcher.session)
+    
+    def test_fetch_range_skips_weekends_and_holidays(self):
+        frame = pd.DataFrame({'SYMBOL': ['AAA']})
+        
+        def fake_fetch(date):
+            return None if date == datetime(2024, 1, 24) else frame
+        
+        with mock.patch.object(self.fetcher, 'fetch_bhavcopy', side_effect=fake_fetch) as fetch:
+            result = self.fetcher.fetch_range(datetime(2024, 1, 24), datetime(2024, 1, 29))
+        
+        # 26th is Republic Day, 27th/28th are a weekend
+        fetched = sorted(call.args[0] for call in fetch.call_args_list)
+        self.assertEqual(fetched, [datetime(2024, 1, 24), datetime(2024, 1, 25), datetime(2024, 1, 29)])
+        self.assertEqual(list(result), [datetime(2024, 1, 25), datetime(2024, 1, 29)])
+
+
+if __name__ == '__main__':
+    unittest.main()